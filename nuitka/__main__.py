@@ -118,6 +118,11 @@ def main():
 
     Options.commentArgs()
 
+    # Plugins need the package configuration, load it while importing them.
+    from nuitka.utils.Yaml import startYamlPackageConfigurationLoading
+
+    startYamlPackageConfigurationLoading()
+
     # Load plugins after we know, we don't execute again.
     from nuitka.plugins.Plugins import activatePlugins
 
@@ -24,9 +24,16 @@ to read their contents.
 from binascii import crc32
 
 from nuitka.__past__ import md5, unicode
+from nuitka.PythonVersions import python_version
 
 from .FileOperations import openTextFile
 
+# These can be given to the hash objects directly, avoiding copies.
+if python_version >= 0x270:
+    _buffer_types = (bytes, bytearray, memoryview)
+else:
+    _buffer_types = (bytes, bytearray)
+
 
 class HashBase(object):
     __slots__ = ("hash",)
@@ -41,7 +48,7 @@ class HashBase(object):
                     value = value.encode("utf8")
 
                 self.updateFromBytes(value)
-            elif type(value) is bytes:
+            elif type(value) in _buffer_types:
                 self.updateFromBytes(value)
             else:
                 assert False, type(value)
@@ -27,9 +27,9 @@ import os
 
 
 def checkModuleName(value):
-    return ".." not in str(value) and not (
-        str(value).endswith(".") or str(value) == "."
-    )
+    value = str(value)
+
+    return ".." not in value and not value.endswith(".")
 
 
 # Trigger names for shared use.
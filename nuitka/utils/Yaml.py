@@ -28,15 +28,31 @@ with these config files.
 # Otherwise "Yaml" and "yaml" collide on case insensitive setups
 from __future__ import absolute_import
 
+import mmap
 import os
+import pickle
 import pkgutil
+import sys
+import threading
+from contextlib import contextmanager
 
 from nuitka.containers.OrderedDicts import OrderedDict
 from nuitka.Options import getUserProvidedYamlFiles
+from nuitka.PythonVersions import python_version, python_version_str
 from nuitka.Tracing import general
 
-from .FileOperations import getFileContents, openTextFile
-from .Hashing import getStringHash
+from .AppDirs import getCacheDir
+from .FileOperations import (
+    deleteFile,
+    getFileContents,
+    getFileSize,
+    listDir,
+    makeContainingPath,
+    openTextFile,
+    putTextFileContents,
+    replaceFileAtomic,
+)
+from .Hashing import getHashFromValues, getStringHash
 from .Importing import importFromInlineCopy
 from .ModuleNames import checkModuleName
 
@@ -45,59 +61,91 @@ class PackageConfigYaml(object):
     __slots__ = (
         "name",
         "data",
+        "sections",
     )
 
     def __init__(self, name, data):
         self.name = name
 
+        # Index by section, created on first use.
+        self.sections = None
+
         assert type(data) is list
 
         self.data = OrderedDict()
 
+        # Local variable for fast access in this potentially long loop.
+        package_data = self.data
+
         for item in data:
-            module_name = item.pop("module-name")
+            module_name = item["module-name"]
+            del item["module-name"]
 
             if not module_name:
-                general.sysexit(
+                error_message = (
                     "Error, invalid config in '%s' looks like an empty module name was given."
-                    % (self.name)
+                    % self.name
                 )
-
-            if "/" in module_name:
-                general.sysexit(
+            elif "/" in module_name:
+                error_message = (
                     "Error, invalid module name in '%s' looks like a file path '%s'."
                     % (self.name, module_name)
                 )
-
-            if not checkModuleName(module_name):
-                general.sysexit(
-                    "Error, invalid module name in '%s' not valid '%s'."
-                    % (self.name, module_name)
+            elif not checkModuleName(module_name):
+                error_message = "Error, invalid module name in '%s' not valid '%s'." % (
+                    self.name,
+                    module_name,
                 )
+            elif module_name in package_data:
+                error_message = "Duplicate module-name '%s' encountered." % module_name
+            else:
+                package_data[module_name] = item
+                continue
+
+            general.sysexit(error_message)
 
-            if module_name in self.data:
-                general.sysexit("Duplicate module-name '%s' encountered." % module_name)
+    @classmethod
+    def fromValidatedData(cls, name, data):
+        """Create from already validated data, e.g. loaded from the cache."""
+        result = cls.__new__(cls)
 
-            self.data[module_name] = item
+        result.name = name
+        result.data = data
+        result.sections = None
+
+        return result
 
     def __repr__(self):
         return "<PackageConfigYaml %s>" % self.name
 
+    def _makeSections(self):
+        sections = {}
+
+        for module_name, item in self.data.items():
+            for section, value in item.items():
+                # TODO: Ought to become a list universally, but data-files
+                # currently are not, and options-nanny too.
+                if isinstance(value, dict):
+                    value = (value,)
+
+                if section not in sections:
+                    sections[section] = {}
+
+                sections[section][module_name] = value
+
+        return sections
+
     def get(self, name, section):
         """Return a configs for that section."""
-        result = self.data.get(name)
+        if self.sections is None:
+            self.sections = self._makeSections()
 
-        if result is not None:
-            result = result.get(section, ())
-        else:
-            result = ()
+        section_data = self.sections.get(section)
 
-        # TODO: Ought to become a list universally, but data-files currently
-        # are not, and options-nanny too.
-        if type(result) in (dict, OrderedDict):
-            result = (result,)
+        if section_data is None:
+            return ()
 
-        return result
+        return section_data.get(name, ())
 
     def keys(self):
         return self.data.keys()
@@ -108,36 +156,37 @@ class PackageConfigYaml(object):
     def update(self, other):
         # TODO: Full blown merging, including respecting an overload flag, where a config
         # replaces another one entirely, for now we expect to not overlap.
-        for key, value in other.items():
-            assert key not in self.data, key
+        if __debug__:
+            # Only a check, and not free, so not done with "-O" mode.
+            overlap = set(self.data).intersection(other.data)
+            assert not overlap, next(iter(overlap))
 
-            self.data[key] = value
+        self.data.update(other.data)
+        self.sections = None
 
 
-def getYamlPackage():
-    if not hasattr(getYamlPackage, "yaml"):
-        try:
-            import yaml
+_yaml_str_pool = {}
 
-            getYamlPackage.yaml = yaml
-        except ImportError:
-            getYamlPackage.yaml = importFromInlineCopy(
-                "yaml", must_exist=True, delete_module=True
-            )
+_yaml_flatten_key_tags = ("tag:yaml.org,2002:merge", "tag:yaml.org,2002:value")
 
-    return getYamlPackage.yaml
 
-
-def parseYaml(data):
-    yaml = getYamlPackage()
+def _makeYamlLoader(yaml):
+    # Prefer the libyaml based loader, it is a lot faster, but the inline
+    # copies do not have it.
+    BaseLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
     # Make sure dictionaries are ordered even before 3.6 in the result. We use
     # them for hashing in caching keys.
-    class OrderedLoader(yaml.SafeLoader):
+    class OrderedLoader(BaseLoader):
         pass
 
     def construct_mapping(loader, node):
-        loader.flatten_mapping(node)
+        # Flattening is only needed for merge and value keys, which are not
+        # used in Nuitka configuration, so checking for them is cheaper.
+        for key_node, _value_node in node.value:
+            if key_node.tag in _yaml_flatten_key_tags:
+                loader.flatten_mapping(node)
+                break
 
         return OrderedDict(loader.construct_pairs(node))
 
@@ -145,38 +194,140 @@ def parseYaml(data):
         yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, construct_mapping
     )
 
-    return yaml.load(data, OrderedLoader)
+    # Keys, module names, and conditions repeat a lot, share one object for
+    # each value, for all parsed files.
+    def construct_str(loader, node):
+        value = loader.construct_yaml_str(node)
+
+        return _yaml_str_pool.setdefault(value, value)
+
+    OrderedLoader.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_SCALAR_TAG, construct_str
+    )
+
+    return OrderedLoader
+
+
+def getYamlPackage():
+    if not hasattr(getYamlPackage, "yaml"):
+        try:
+            import yaml
+        except ImportError:
+            yaml = importFromInlineCopy("yaml", must_exist=True, delete_module=True)
+
+        # The loader class is created only once, set it first, since "yaml"
+        # being present is what is checked.
+        getYamlPackage.loader = _makeYamlLoader(yaml)
+        getYamlPackage.yaml = yaml
+
+    return getYamlPackage.yaml
+
+
+def parseYaml(data):
+    yaml = getYamlPackage()
+
+    return yaml.load(data, getYamlPackage.loader)
 
 
 _yaml_cache = {}
 
+# Checksum and stats of package Yaml files, if these were validated.
+_yaml_source_infos = {}
+
+
+def _getYamlChecksumLineRange(yaml_data):
+    """Start and end offset of the checksum line, None if there is none."""
+    start = 0
+
+    for _count in range(4):
+        start = yaml_data.find(b"\n", start) + 1
+
+        if start == 0:
+            return None
+
+    # Slice comparison, since "mmap" objects have no "startswith" method.
+    if yaml_data[start : start + 11] != b"# checksum:":
+        return None
+
+    end = yaml_data.find(b"\n", start)
+    if end == -1:
+        return None
+
+    return start, end
+
 
 def getYamlFileChecksum(yaml_data):
-    lines = yaml_data.splitlines()
-    if len(lines) > 4 and lines[4].startswith(b"# checksum: "):
-        return lines[4].split()[2]
+    """Checksum from the header of Yaml data, None if not present.
 
-    return None
+    Only the header needs to be given, the first lines are enough.
+    """
+    checksum_line_range = _getYamlChecksumLineRange(yaml_data)
+
+    if checksum_line_range is None:
+        return None
+
+    start, end = checksum_line_range
+    checksum_line = yaml_data[start:end]
+
+    if not checksum_line.startswith(b"# checksum: "):
+        return None
+
+    return checksum_line[12:].strip() or None
+
+
+def _getYamlPayloadRange(yaml_data):
+    """Start and end offset of the document after the header, None if none.
+
+    This is the part covered by the checksum, only up to a potential next
+    document.
+    """
+    start = yaml_data.find(b"\n---\n")
+
+    if start == -1:
+        return None
+
+    start += 5
+
+    end = yaml_data.find(b"\n---\n", start)
+    if end == -1:
+        end = len(yaml_data)
+
+    return start, end
+
+
+def _calculateYamlPayloadChecksum(yaml_data, start, end):
+    # Avoid copying the potentially large payload just for hashing it.
+    if python_version >= 0x270:
+        payload = memoryview(yaml_data)[start:end]
+    else:
+        payload = yaml_data[start:end]
+
+    return getStringHash(payload).encode("utf8")
 
 
 def _calculateYamlFileChecksum(yaml_data):
-    if b"\n---\n" not in yaml_data:
-        raise ValueError("Malformed yaml data without --- header")
+    payload_range = _getYamlPayloadRange(yaml_data)
 
-    yaml_data = yaml_data.split(b"\n---\n", 2)[1]
+    if payload_range is None:
+        raise ValueError("Malformed yaml data without --- header")
 
-    return getStringHash(yaml_data).encode("utf8")
+    return _calculateYamlPayloadChecksum(yaml_data, *payload_range)
 
 
 def checkOrUpdateChecksum(filename, update, logger):
     yaml_data_old = getFileContents(filename, mode="rb")
-    lines = yaml_data_old.splitlines()
+    checksum_line_range = _getYamlChecksumLineRange(yaml_data_old)
 
-    if len(lines) < 5 or not lines[4].startswith(b"# checksum:"):
+    if checksum_line_range is None:
         logger.sysexit("Make sure the file is autoformatted first.")
 
-    lines[4] = b"# checksum: %s" % _calculateYamlFileChecksum(yaml_data_old)
-    yaml_data_new = b"\n".join(lines) + b"\n"
+    start, end = checksum_line_range
+
+    yaml_data_new = (
+        yaml_data_old[:start]
+        + b"# checksum: %s" % _calculateYamlFileChecksum(yaml_data_old)
+        + yaml_data_old[end:]
+    )
 
     if yaml_data_new != yaml_data_old:
         if update:
@@ -192,84 +343,669 @@ def checkOrUpdateChecksum(filename, update, logger):
         logger.info("OK, checksum valid.", style="blue")
 
 
-def parsePackageYaml(package_name, filename):
-    key = package_name, filename
+def _isYamlCacheDisabled():
+    return os.getenv("NUITKA_DISABLE_YAML_CACHE") is not None
 
-    if key not in _yaml_cache:
+
+def _getYamlCacheDir():
+    # The mapping type used differs between Python versions, and so does the
+    # pickle protocol, therefore keep them apart.
+    return os.path.join(getCacheDir(), "yaml", python_version_str)
+
+
+# Cache files of other checkouts or versions are kept, these share the cache
+# directory, but not too many of them.
+_yaml_cache_keep_count = 20
+
+
+def _getYamlCacheFilenamePrefix(filename, file_checksum):
+    return "%s-%s-" % (os.path.basename(filename), file_checksum.decode("utf8"))
+
+
+def _getYamlCacheFilename(filename, file_checksum, file_stats):
+    # The stats are part of the name, so files with the same contents, e.g.
+    # in different checkouts, have their own cache files.
+    return os.path.join(
+        _getYamlCacheDir(),
+        "%s%s.pickle"
+        % (
+            _getYamlCacheFilenamePrefix(filename, file_checksum),
+            getHashFromValues(repr(file_stats)),
+        ),
+    )
+
+
+def _loadYamlCache(cache_filename):
+    """Load a Yaml cache file.
+
+    Returns:
+        tuple of the source file stats it was written for, and the data, or
+        None if there is no usable cache file.
+    """
+    if not os.path.exists(cache_filename):
+        return None
+
+    try:
+        with openTextFile(cache_filename, "rb") as cache_file:
+            result = pickle.load(cache_file)
+    except Exception:  # Catch all the things, pylint: disable=broad-except
+        # Corrupt or incompatible cache files are just ignored, and will be
+        # overwritten.
+        return None
+
+    if type(result) is not tuple or len(result) != 2:
+        return None
+
+    return result
+
+
+def _findYamlCache(prefix):
+    """Load any usable Yaml cache file with a name starting with prefix."""
+    if not os.path.isdir(_getYamlCacheDir()):
+        return None
+
+    for other_filename, other_basename in listDir(_getYamlCacheDir()):
+        if other_basename.startswith(prefix) and other_basename.endswith(".pickle"):
+            cache_result = _loadYamlCache(other_filename)
+
+            if cache_result is not None:
+                return cache_result
+
+    return None
+
+
+def _loadValidatedYamlCache(filename, file_checksum, file_stats):
+    """Load a Yaml cache for a file with validated checksum.
+
+    The cache contents can be used even if written for another file with the
+    same contents, e.g. in another checkout.
+
+    Returns:
+        tuple of the cache filename to use, None if caching is disabled, and
+        the loaded cache, None if there is none.
+    """
+    if _isYamlCacheDisabled():
+        return None, None
+
+    cache_filename = _getYamlCacheFilename(filename, file_checksum, file_stats)
+    result = _loadYamlCache(cache_filename)
+
+    if result is None:
+        result = _findYamlCache(_getYamlCacheFilenamePrefix(filename, file_checksum))
+
+    return cache_filename, result
+
+
+def _removeStaleYamlCaches(stale_prefix):
+    """Remove the oldest cache files for a source, if there are too many."""
+    cache_files = []
+
+    for other_filename, other_basename in listDir(_getYamlCacheDir()):
+        if other_basename.startswith(stale_prefix) and other_basename.endswith(
+            ".pickle"
+        ):
+            try:
+                cache_files.append((os.path.getmtime(other_filename), other_filename))
+            except OSError:
+                # Removed by another process already.
+                continue
+
+    cache_files.sort(reverse=True)
+
+    for _mtime, other_filename in cache_files[_yaml_cache_keep_count:]:
+        deleteFile(other_filename, must_exist=False)
+
+
+def _needsAtomicWrites():
+    # For Python2, renaming only replaces files atomically on POSIX, and the
+    # inline copy of "atomicwrites" is only installed on Windows.
+    return python_version < 0x300 and os.name == "nt"
+
+
+def _replaceYamlCacheFile(tmp_filename, cache_filename):
+    if python_version >= 0x300 or _needsAtomicWrites():
+        replaceFileAtomic(tmp_filename, cache_filename)
+    else:
+        os.rename(tmp_filename, cache_filename)
+
+
+def _writeYamlCache(cache_filename, data, source_stats, stale_prefix):
+    tmp_filename = cache_filename + ".tmp%d" % os.getpid()
+
+    try:
+        makeContainingPath(cache_filename)
+
+        with openTextFile(tmp_filename, "wb") as cache_file:
+            pickle.dump(
+                (source_stats, data), cache_file, protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+        _replaceYamlCacheFile(tmp_filename, cache_filename)
+
+        # Otherwise every change would leave one behind.
+        _removeStaleYamlCaches(stale_prefix)
+    except (IOError, OSError):
+        # Not being able to write the cache is not an error, it only makes
+        # the next run slower.
+        deleteFile(tmp_filename, must_exist=False)
+
+
+def _getPackageResourceFilename(package_name, filename):
+    """Filename of a package resource, None if it's not a plain file."""
+    try:
+        __import__(package_name)
+    except ImportError:
+        raise IOError("Cannot find %s.%s" % (package_name, filename))
+
+    package_filename = getattr(sys.modules[package_name], "__file__", None)
+
+    if package_filename is None:
+        return None
+
+    package_dir = os.path.dirname(package_filename)
+
+    if not os.path.isdir(package_dir):
+        # Zip files and the like, need to use "pkgutil" then.
+        return None
+
+    result = os.path.join(package_dir, filename)
+
+    if not os.path.isfile(result):
+        raise IOError("Cannot find %s.%s" % (package_name, filename))
+
+    return result
+
+
+def _getFileStats(filename):
+    # The cache directory is shared, e.g. between different checkouts, so
+    # the full path is needed to identify a file.
+    stat_result = os.stat(filename)
+
+    return os.path.abspath(filename), stat_result.st_size, stat_result.st_mtime
+
+
+def _getPackageYamlFileStats(package_name, filename):
+    """Stats identifying a package Yaml file, None if it's not a plain file."""
+    yaml_filename = _getPackageResourceFilename(package_name, filename)
+
+    if yaml_filename is None:
+        return None
+
+    return _getFileStats(yaml_filename)
+
+
+def _readYamlChecksumOnly(package_name, filename):
+    """Read the checksum from the header of a package Yaml file only.
+
+    Returns:
+        tuple of checksum and stats of the file, or None if the file is not
+        a plain file or has no checksum header. Since the contents are not
+        validated, caches are only usable if written for the same stats.
+    """
+    yaml_filename = _getPackageResourceFilename(package_name, filename)
+
+    if yaml_filename is None:
+        return None
+
+    file_stats = _getFileStats(yaml_filename)
+
+    with openTextFile(yaml_filename, "rb") as yaml_file:
+        header = yaml_file.read(512)
+
+    file_checksum = getYamlFileChecksum(header)
+
+    if file_checksum is None:
+        return None
+
+    return file_checksum, file_stats
+
+
+def _checkPackageYamlData(data):
+    """Check the checksum of package Yaml data.
+
+    Returns:
+        tuple of the checksum from the header, the validation result, and
+        the range of the payload, for use with "_getPackageYamlPayload".
+    """
+    file_checksum = getYamlFileChecksum(data)
+    payload_range = _getYamlPayloadRange(data)
+
+    if file_checksum is None:
+        validated = "not present"
+    elif payload_range is None or file_checksum != _calculateYamlPayloadChecksum(
+        data, *payload_range
+    ):
+        validated = "not matching"
+    else:
+        validated = "matching"
+
+    return file_checksum, validated, payload_range
+
+
+def _getPackageYamlPayload(data, payload_range):
+    """Get the payload of package Yaml data to parse.
+
+    The header before has only comments and no directives, so the parser need
+    not scan it. It's replaced with empty lines, so line numbers in parse
+    errors still match the file.
+    """
+    if payload_range is None:
+        # Slicing also gives a bytes object for "mmap" data.
+        return data[:]
+
+    start, end = payload_range
+
+    # Only the header is copied for counting, it's small.
+    padding = b"\n" * data[:start].count(b"\n")
+
+    # Copy the payload only once, for Python2 "join" needs "str" objects.
+    if python_version >= 0x300:
+        return b"".join((padding, memoryview(data)[start:end]))
+    else:
+        return padding + data[start:end]
+
+
+@contextmanager
+def _openPackageYaml(package_name, filename):
+    """Open a package Yaml file, giving its data.
+
+    Notes:
+        The data is only usable inside the context, since it might be
+        mapped from the file.
+    """
+    # For Python2, "mmap" objects cannot be used for "memoryview".
+    if python_version >= 0x300:
+        yaml_filename = _getPackageResourceFilename(package_name, filename)
+    else:
+        yaml_filename = None
+
+    if yaml_filename is not None and getFileSize(yaml_filename) > 0:
+        # Mapping the file avoids reading all of it into memory, only the
+        # payload becomes a copy, if it needs to be parsed.
+        with openTextFile(yaml_filename, "rb") as yaml_file:
+            data = mmap.mmap(yaml_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            yield data
+        finally:
+            data.close()
+    else:
         data = pkgutil.get_data(package_name, filename)
 
         if data is None:
             raise IOError("Cannot find %s.%s" % (package_name, filename))
 
-        validated = "False"
+        yield data
 
-        lines = data.splitlines()
-        if len(lines) > 4:
-            if lines[4].startswith(b"# checksum: "):
-                file_checksum = lines[4].split()[2]
 
-                if file_checksum != _calculateYamlFileChecksum(data):
-                    validated = "not matching"
-                else:
-                    validated = "matching"
+def _getGeneratedPackageYaml(filename, file_checksum):
+    """Data of Nuitka provided package configuration generated on install."""
+    # Dictionary literals are only ordered for 3.6 or higher.
+    if python_version < 0x360:
+        return None
+
+    try:
+        # Only present in installations, pylint: disable=I0021,no-name-in-module
+        from .YamlConfigData import package_configs
+    except ImportError:
+        return None
+
+    if filename not in package_configs:
+        return None
+
+    generated_checksum, data = package_configs[filename]
+
+    if generated_checksum != file_checksum:
+        return None
+
+    return data
+
+
+def writeYamlPackageConfigurationModule(output_filename):
+    """Write a module with the parsed Nuitka provided package configuration.
+
+    Notes:
+        Used by "setup.py" for installation, such that the Yaml files need
+        not be parsed at run time or be cached first.
+    """
+
+    if python_version < 0x360:
+        return
+
+    lines = [
+        "# Generated during installation from the package configuration Yaml",
+        "# files, do not edit.",
+        "package_configs = {",
+    ]
+
+    for package_name, filename in _builtin_yaml_files:
+        if package_name != "nuitka.plugins.standard":
+            continue
+
+        with _openPackageYaml(package_name, filename) as data:
+            file_checksum, validated, payload_range = _checkPackageYamlData(data)
+
+            # Without matching checksum, we cannot tell if it's still current.
+            if validated != "matching":
+                continue
+
+            package_config = PackageConfigYaml(
+                name=filename,
+                data=parseYaml(_getPackageYamlPayload(data, payload_range)),
+            )
+
+        lines.append(
+            "    %r: (%r, %r)," % (filename, file_checksum, package_config.data)
+        )
+
+    lines.append("}")
+
+    makeContainingPath(output_filename)
+    putTextFileContents(output_filename, lines)
+
+
+def _loadCachedPackageYaml(package_name, filename):
+    """Fast path, only reading the header of the file for the checksum.
+
+    The cache file was written after validating the file with these stats,
+    None is returned if there is no such cache file.
+    """
+    checksum_info = _readYamlChecksumOnly(package_name, filename)
+
+    if checksum_info is None:
+        return None
+
+    file_checksum, file_stats = checksum_info
+
+    cache_result = _loadYamlCache(
+        _getYamlCacheFilename(filename, file_checksum, file_stats)
+    )
+
+    if cache_result is None or cache_result[0] != file_stats:
+        return None
+
+    _yaml_source_infos[package_name, filename] = checksum_info
+
+    return PackageConfigYaml.fromValidatedData(name=filename, data=cache_result[1])
+
+
+def parsePackageYaml(package_name, filename):
+    key = package_name, filename
+
+    if key not in _yaml_cache and not _isYamlCacheDisabled():
+        package_config = _loadCachedPackageYaml(package_name, filename)
+
+        if package_config is not None:
+            _yaml_cache[key] = package_config
+
+    if key not in _yaml_cache:
+        # Before reading, so a change while doing it is not attributed to it.
+        file_stats = _getPackageYamlFileStats(package_name, filename)
+
+        with _openPackageYaml(package_name, filename) as data:
+            file_checksum, validated, payload_range = _checkPackageYamlData(data)
+
+            # Only files with a valid checksum can be cached, otherwise we
+            # cannot tell if the cache file is still current. And generated
+            # data is only used then, since the user might have changed the
+            # file after installation.
+            if validated != "matching":
+                general.warning(
+                    "Using file %s with %s checksum." % (filename, validated)
+                )
+
+                cache_filename = cache_result = config_data = None
             else:
-                validated = "not present"
-        else:
-            validated = "not present"
+                if file_stats is not None:
+                    _yaml_source_infos[key] = file_checksum, file_stats
+
+                cache_filename, cache_result = _loadValidatedYamlCache(
+                    filename, file_checksum, file_stats
+                )
 
-        if validated != "matching":
-            general.warning("Using file %s with %s checksum." % (filename, validated))
+                if cache_result is not None:
+                    config_data = cache_result[1]
+                else:
+                    config_data = _getGeneratedPackageYaml(filename, file_checksum)
 
-        _yaml_cache[key] = PackageConfigYaml(name=filename, data=parseYaml(data))
+            if config_data is not None:
+                _yaml_cache[key] = PackageConfigYaml.fromValidatedData(
+                    name=filename, data=config_data
+                )
+            else:
+                # Parsing is the only use of the payload, and it's a copy.
+                _yaml_cache[key] = PackageConfigYaml(
+                    name=filename,
+                    data=parseYaml(_getPackageYamlPayload(data, payload_range)),
+                )
+
+        # Record these file stats, for the fast path to be usable next time.
+        if cache_filename is not None and (
+            cache_result is None or cache_result[0] != file_stats
+        ):
+            _writeYamlCache(
+                cache_filename,
+                _yaml_cache[key].data,
+                source_stats=file_stats,
+                stale_prefix=os.path.basename(filename) + "-",
+            )
 
     return _yaml_cache[key]
 
 
-_package_config = None
+# The Nuitka provided configuration files, in the order they are merged, the
+# commercial one is optional.
+_builtin_yaml_files = (
+    ("nuitka.plugins.standard", "standard.nuitka-package.config.yml"),
+    ("nuitka.plugins.standard", "stdlib2.nuitka-package.config.yml"),
+    ("nuitka.plugins.standard", "stdlib3.nuitka-package.config.yml"),
+    ("nuitka.plugins.commercial", "commercial.nuitka-package.config.yml"),
+)
 
 
-def getYamlPackageConfiguration():
-    """Get Nuitka package configuration. Merged from multiple sources."""
-    # Singleton, pylint: disable=global-statement
-    global _package_config
+def _getBuiltinYamlSourceInfos():
+    """Checksums and stats from the headers of the Nuitka provided files.
 
-    if _package_config is None:
-        _package_config = parsePackageYaml(
-            "nuitka.plugins.standard",
-            "standard.nuitka-package.config.yml",
-        )
-        _package_config.update(
-            parsePackageYaml(
-                "nuitka.plugins.standard",
-                "stdlib2.nuitka-package.config.yml",
+    Returns:
+        tuple with checksum and stats per file, None for missing files, or
+        None if not all files have these.
+    """
+    result = []
+
+    for package_name, filename in _builtin_yaml_files:
+        try:
+            source_info = _readYamlChecksumOnly(package_name, filename)
+        except IOError:
+            # Optional files, e.g. the commercial one, might not be present.
+            result.append(None)
+            continue
+
+        if source_info is None:
+            return None
+
+        result.append(source_info)
+
+    return tuple(result)
+
+
+def _getMergedYamlCacheFilename(source_infos, user_yaml_files):
+    """Cache filename for the merged configuration.
+
+    The name is derived from the checksums and stats of the Nuitka provided
+    files and the contents of the user provided files, so any change to these
+    makes for a new cache file.
+    """
+    key_values = []
+
+    for (_package_name, filename), source_info in zip(
+        _builtin_yaml_files, source_infos
+    ):
+        if source_info is None:
+            key_values.append("%s:missing" % filename)
+        else:
+            file_checksum, file_stats = source_info
+
+            key_values.append(
+                "%s:%s:%r" % (filename, file_checksum.decode("utf8"), file_stats)
             )
+
+    for user_yaml_filename, user_yaml_contents in user_yaml_files:
+        key_values.append(
+            "%s:%s"
+            % (os.path.abspath(user_yaml_filename), getStringHash(user_yaml_contents))
         )
-        _package_config.update(
-            parsePackageYaml(
-                "nuitka.plugins.standard",
-                "stdlib3.nuitka-package.config.yml",
+
+    return os.path.join(
+        _getYamlCacheDir(), "merged-%s.pickle" % getHashFromValues(*key_values)
+    )
+
+
+def _getSourceInfosStats(source_infos):
+    return tuple(
+        source_info[1] if source_info is not None else None
+        for source_info in source_infos
+    )
+
+
+def _loadYamlPackageConfiguration():
+    # Read only once, for the cache key and for parsing.
+    user_yaml_files = [
+        (user_yaml_filename, getFileContents(user_yaml_filename, mode="rb"))
+        for user_yaml_filename in getUserProvidedYamlFiles()
+    ]
+
+    if not _isYamlCacheDisabled():
+        # Only the headers of the files are read, so only cache files written
+        # for the same file stats can be trusted.
+        source_infos = _getBuiltinYamlSourceInfos()
+
+        if source_infos is not None:
+            cache_result = _loadYamlCache(
+                _getMergedYamlCacheFilename(source_infos, user_yaml_files)
             )
-        )
 
-        try:
-            _package_config.update(
-                parsePackageYaml(
-                    "nuitka.plugins.commercial", "commercial.nuitka-package.config.yml"
+            if cache_result is not None and cache_result[0] == _getSourceInfosStats(
+                source_infos
+            ):
+                return PackageConfigYaml.fromValidatedData(
+                    name=_builtin_yaml_files[0][1], data=cache_result[1]
                 )
-            )
+
+    result = None
+
+    # The checksums and stats used while parsing, if all files were validated,
+    # the merged result can be cached for these.
+    source_infos = []
+    merged_cacheable = not _isYamlCacheDisabled()
+
+    for package_name, filename in _builtin_yaml_files:
+        try:
+            package_config = parsePackageYaml(package_name, filename)
         except IOError:
             # No commercial configuration found.
-            pass
-
-        # User or plugin provided filenames, but we want PRs though, and will nag
-        # about it somewhat.
-        for user_yaml_filename in getUserProvidedYamlFiles():
-            _package_config.update(
-                PackageConfigYaml(
-                    name=user_yaml_filename,
-                    data=parseYaml(getFileContents(user_yaml_filename, mode="rb")),
-                )
+            if package_name != "nuitka.plugins.commercial":
+                raise
+
+            source_infos.append(None)
+            continue
+
+        if result is None:
+            result = package_config
+        else:
+            result.update(package_config)
+
+        if (package_name, filename) not in _yaml_source_infos:
+            merged_cacheable = False
+
+        source_infos.append(_yaml_source_infos.get((package_name, filename)))
+
+    # User or plugin provided filenames, but we want PRs though, and will nag
+    # about it somewhat.
+    for user_yaml_filename, user_yaml_contents in user_yaml_files:
+        result.update(
+            PackageConfigYaml(
+                name=user_yaml_filename, data=parseYaml(user_yaml_contents)
             )
+        )
+
+    if merged_cacheable:
+        _writeYamlCache(
+            _getMergedYamlCacheFilename(source_infos, user_yaml_files),
+            result.data,
+            source_stats=_getSourceInfosStats(source_infos),
+            stale_prefix="merged-",
+        )
+
+    return result
+
+
+class _YamlPackageConfigurationThread(threading.Thread):
+    def __init__(self):
+        threading.Thread.__init__(self)
+
+        # Must not prevent exiting, e.g. on errors elsewhere.
+        self.daemon = True
+
+        self.result = None
+        self.exception = None
+
+    def run(self):
+        try:
+            self.result = _loadYamlPackageConfiguration()
+        except BaseException as e:  # will rethrow all, pylint: disable=broad-except
+            # Also catches "sysexit" for configuration errors, that would only
+            # end this thread.
+            self.exception = e
+
+
+_package_config = None
+_package_config_thread = None
+
+
+def startYamlPackageConfigurationLoading():
+    """Start loading the Nuitka package configuration in the background.
+
+    Notes:
+        Must only be called after options are parsed, since user provided
+        files are part of it. Plugins will need it, and loading them can
+        happen at the same time.
+    """
+    # Singleton, pylint: disable=global-statement
+    global _package_config_thread
+
+    if os.getenv("NUITKA_DISABLE_YAML_THREAD") is not None:
+        return
+
+    if _package_config is None and _package_config_thread is None:
+        # Inline copies are imported by temporarily changing "sys.path", which
+        # must not happen in the thread, while the main thread imports too.
+        getYamlPackage()
+
+        if _needsAtomicWrites():
+            importFromInlineCopy("atomicwrites", must_exist=True)
+
+        _package_config_thread = _YamlPackageConfigurationThread()
+        _package_config_thread.start()
+
+
+def getYamlPackageConfiguration():
+    """Get Nuitka package configuration. Merged from multiple sources."""
+    # Singleton, pylint: disable=global-statement
+    global _package_config, _package_config_thread
+
+    if _package_config_thread is not None:
+        thread = _package_config_thread
+        _package_config_thread = None
+
+        thread.join()
+
+        if thread.exception is not None:
+            raise thread.exception
+
+        _package_config = thread.result
+
+    if _package_config is None:
+        _package_config = _loadYamlPackageConfiguration()
 
     return _package_config
 
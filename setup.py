@@ -40,12 +40,14 @@ import re
 
 from setuptools import Distribution, setup
 from setuptools.command import easy_install
+from setuptools.command.build_py import build_py
 
 # TODO: We need a better solution for this, probably error exit, once sys.exit
 # is optimized for. This is to avoid descending into Nuitka through distutils.
 if __name__ == "__main__":
     from nuitka.PythonFlavors import isMSYS2MingwPython
     from nuitka.utils.FileOperations import getFileList
+    from nuitka.utils.Yaml import writeYamlPackageConfigurationModule
     from nuitka.Version import getNuitkaVersion
 
 scripts = []
@@ -350,6 +352,19 @@ class BinaryDistribution(Distribution):
         return True
 
 
+# Installations get the package configuration pre-parsed, avoiding to do it
+# at run time, this is not done for the source tree.
+class NuitkaBuildPy(build_py):
+    """Build command that also adds the parsed package configuration"""
+
+    def run(self):
+        build_py.run(self)
+
+        writeYamlPackageConfigurationModule(
+            os.path.join(self.build_lib, "nuitka", "utils", "YamlConfigData.py")
+        )
+
+
 with open("README.rst", "rb") as input_file:
     long_description = input_file.read().decode("utf8")
 
@@ -457,4 +472,5 @@ Python compiler with full language support and CPython compatibility""",
     # As we do version specific hacks for installed inline copies, make the
     # wheel version and platform specific.
     distclass=BinaryDistribution,
+    cmdclass={"build_py": NuitkaBuildPy},
 )